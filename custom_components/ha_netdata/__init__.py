@@ -1,5 +1,5 @@
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform, CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
+from homeassistant.const import Platform, CONF_HOST, CONF_PORT, CONF_RESOURCES, CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
 from .sensor import NetdataData
 from .const import DOMAIN
@@ -11,7 +11,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = config[CONF_HOST]
     port = config[CONF_PORT]
     interval = config[CONF_SCAN_INTERVAL]
-    netdata = NetdataData(hass, host, port, interval)
+    chart_filter = frozenset(res.partition("/")[0] for res in config[CONF_RESOURCES])
+    keys = frozenset(
+        (chart, element)
+        for chart, _, element in (res.partition("/") for res in config[CONF_RESOURCES])
+    )
+    netdata = NetdataData(hass, host, port, interval, chart_filter, keys)
     await netdata.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
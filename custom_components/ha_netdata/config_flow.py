@@ -1,7 +1,11 @@
 from __future__ import annotations
 import logging
 import requests
-import json
+
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -14,7 +18,30 @@ from .const import CONF_DOMAINS, DOMAIN
 _LOGGER = logging.getLogger(__name__)
 
 
-class NetdataFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
+class NetdataMetricsMixin:
+    """Fetch allmetrics and index the charts by domain."""
+
+    async def _async_load_metrics(self, host, port):
+        request_netdata = await self.hass.async_add_executor_job(
+            requests.get,
+            f"http://{host}:{port}/api/v1/allmetrics?format=json&help=no&types=no&timestamps=yes&names=yes&data=average"
+        )
+        self.metrics = orjson.loads(request_netdata.content)
+        self._by_domain = {}
+        for chart in self.metrics:
+            self._by_domain.setdefault(chart.partition(".")[0], []).append(chart)
+        self.domains = sorted(self._by_domain)
+
+    def _sensors_for_domains(self, domains):
+        sensors = []
+        for domain in domains:
+            for chart in self._by_domain.get(domain, ()):
+                for element in self.metrics[chart]["dimensions"]:
+                    sensors.append(f"{chart}/{element}")
+        return sorted(sensors)
+
+
+class NetdataFlowHandler(NetdataMetricsMixin, config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Met Eireann component."""
 
     VERSION = 1
@@ -24,13 +51,7 @@ class NetdataFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            request_netdata = await self.hass.async_add_executor_job(
-                requests.get,
-                f"http://{user_input[CONF_HOST]}:{user_input[CONF_PORT]}/api/v1/allmetrics?format=json&help=no&types=no&timestamps=yes&names=yes&data=average"
-            )
-            self.metrics = json.loads(request_netdata.content)
-            self.domains = sorted(
-                list({m.split(".")[0] for m in self.metrics}))
+            await self._async_load_metrics(user_input[CONF_HOST], user_input[CONF_PORT])
             self.config = user_input
             return await self.async_step_domains()
 
@@ -51,13 +72,7 @@ class NetdataFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
 
         if user_input is not None:
-            self.sensors = []
-            for sensor, data in self.metrics.items():
-                if sensor.split(".")[0] not in user_input[CONF_DOMAINS]:
-                    continue
-                for element in data["dimensions"].keys():
-                    self.sensors.append(f"{sensor}/{element}")
-            self.sensors = sorted(self.sensors)
+            self.sensors = self._sensors_for_domains(user_input[CONF_DOMAINS])
             self.config.update(user_input)
             return await self.async_step_sensors()
 
@@ -101,29 +116,21 @@ class NetdataFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         return OptionsFlowHandler(config_entry)
 
 
-class OptionsFlowHandler(config_entries.OptionsFlow):
+class OptionsFlowHandler(NetdataMetricsMixin, config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self.config_entry = config_entry
         self.config = dict(config_entry.data)
+        self.metrics = None
 
     async def async_step_init(self, user_input=None):
-        request_netdata = await self.hass.async_add_executor_job(
-            requests.get,
-            f"http://{self.config[CONF_HOST]}:{self.config[CONF_PORT]}/api/v1/allmetrics?format=json&help=no&types=no&timestamps=yes&names=yes&data=average"
-        )
-        self.metrics = json.loads(request_netdata.content)
-        self.domains = sorted(
-            list({m.split(".")[0] for m in self.metrics}))
+        # The host cannot change in the options flow, so the listing fetched
+        # for the first render is reused when the form is submitted.
+        if self.metrics is None:
+            await self._async_load_metrics(self.config[CONF_HOST], self.config[CONF_PORT])
 
         if user_input is not None:
-            self.sensors = []
-            for sensor, data in self.metrics.items():
-                if sensor.split(".")[0] not in user_input[CONF_DOMAINS]:
-                    continue
-                for element in data["dimensions"].keys():
-                    self.sensors.append(f"{sensor}/{element}")
-            self.sensors = sorted(self.sensors)
+            self.sensors = self._sensors_for_domains(user_input[CONF_DOMAINS])
             self.config.update(user_input)
             return await self.async_step_sensors()
 
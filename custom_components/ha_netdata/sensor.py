@@ -1,9 +1,16 @@
 """Support gathering system information of hosts which are running netdata."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
+import sys
+from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -20,7 +27,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfPower
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.config_entries import ConfigEntry
@@ -30,6 +37,30 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_KBITS_S_TO_MBYTES_S = 1.0 / (1024.0 * 8.0)
+
+# netdata unit (lowercased) -> (native unit, device class)
+_UNIT_MAP = {
+    "kilobits/s": (UnitOfDataRate.MEGABYTES_PER_SECOND, None),
+    "percentage": (PERCENTAGE, None),
+    "watts": (UnitOfPower.WATT, SensorDeviceClass.POWER),
+    "celsius": (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+}
+
+# netdata unit (lowercased) -> icon; None lets the device class pick the icon
+_UNIT_ICON_MAP = {
+    "watts": None,
+    "celsius": None,
+}
+
+_DISMISS_STATUSES = frozenset({"CLEAR", "UNDEFINED", "UNINITIALIZED"})
+
+_ALARM_ICONS = {
+    "ok": "mdi:check",
+    "warning": "mdi:alert-outline",
+    "critical": "mdi:alert",
+}
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -43,13 +74,20 @@ async def async_setup_entry(
     resources = config[CONF_RESOURCES]
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
+    units = coordinator.data["units"]
+    missing = set()
+    unique_id_prefix = f"netdata-{host}-{port}-"
     dev: list[SensorEntity] = []
     for res in resources:
-        [sensor, element] = res.split("/")
-        unique_id = f"netdata-{host}-{port}-{sensor}-{element}"
+        sensor, _, element = res.partition("/")
+        if units.get(sensor) is None:
+            if sensor not in missing:
+                missing.add(sensor)
+                _LOGGER.error("Sensor %s is not available on host %s", sensor, host)
+            continue
         dev.append(
             NetdataSensor(
-                coordinator, unique_id, name, sensor, element
+                coordinator, f"{unique_id_prefix}{sensor}-{element}", name, sensor, element
             )
         )
 
@@ -60,78 +98,76 @@ async def async_setup_entry(
 class NetdataSensor(CoordinatorEntity, SensorEntity):
     """Implementation of a Netdata sensor."""
 
+    # Entity has no __slots__, so instances keep a __dict__ and this saves
+    # no memory; it only makes these fields fixed, descriptor-backed slots.
+    __slots__ = (
+        "_sensor",
+        "_element",
+        "_key",
+        "_unit_lower",
+        "_value_scale",
+        "_round_digits",
+    )
+
     def __init__(self, coordinator, unique_id, name, sensor, element):
         """Initialize the Netdata sensor."""
         super().__init__(coordinator)
-        self._unique_id = unique_id
-        self._state = None
-        self._sensor = sensor
-        self._element = element
-        self._name = name
+        self._sensor = sensor = sys.intern(sensor)
+        self._element = element = sys.intern(element)
+        self._key = (sensor, element)
+
+        self._attr_unique_id = unique_id
+        self._attr_name = f"{name} {sensor} {element}"
 
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-        self._icon = "mdi:chart-line"
+        icon = "mdi:chart-line"
         if "net." in self._sensor:
             if "received" in self._element:
-                self._icon = "mdi:download"
+                icon = "mdi:download"
             elif "sent" in self._element:
-                self._icon = "mdi:upload"
-        
-        unit = self.coordinator.data["metrics"][self._sensor]["units"]
-        self._unit_lower = str(unit).lower()
-        if self._unit_lower == "kilobits/s":
-            self._attr_native_unit_of_measurement = UnitOfDataRate.MEGABYTES_PER_SECOND
-        elif self._unit_lower == "percentage":
-            self._attr_native_unit_of_measurement = PERCENTAGE
-        elif self._unit_lower == "watts":
-            self._attr_native_unit_of_measurement = UnitOfPower.WATT
-            self._attr_device_class = SensorDeviceClass.POWER
-            self._icon = None
-        elif self._unit_lower == "celsius":
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            self._icon = None
-        else:
-            self._attr_native_unit_of_measurement = unit
-        
-        
+                icon = "mdi:upload"
 
-    @property
-    def unique_id(self):
-        return self._unique_id
+        unit = self.coordinator.data["units"][self._sensor]
+        # Units come from a small vocabulary; share one string per unit.
+        self._unit_lower = sys.intern(str(unit).lower())
+        native_unit, device_class = _UNIT_MAP.get(self._unit_lower, (unit, None))
+        self._attr_native_unit_of_measurement = native_unit
+        if device_class is not None:
+            self._attr_device_class = device_class
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{self._name} {self._sensor} {self._element}"
+        if self._unit_lower == "kilobits/s":
+            self._value_scale = _KBITS_S_TO_MBYTES_S
+            self._round_digits = 3
+        else:
+            self._value_scale = 1.0
+            self._round_digits = 2
 
-    @property
-    def icon(self):
-        """Return the icon to use in the frontend, if any."""
-        return self._icon
-    
-    @property
-    def available(self) -> bool:
-        return (
-            super().available
-            and self.coordinator.data["metrics"].get(self._sensor) is not None
-        )
+        self._attr_icon = _UNIT_ICON_MAP.get(self._unit_lower, icon)
 
-    @property
-    def native_value(self):
-        """Return the state of the resources."""
-        resource_data = self.coordinator.data["metrics"].get(self._sensor)
-        if resource_data is None:
-            return None
+        self._update_from_data()
 
-        value = round(
-            abs(resource_data["dimensions"][self._element]["value"]), 2)
+    def _update_from_data(self):
+        value = self.coordinator.data["flat"].get(self._key)
+        if value is None:
+            self._attr_available = False
+            self._attr_native_value = None
+        else:
+            self._attr_available = True
+            self._attr_native_value = round(
+                abs(value) * self._value_scale, self._round_digits
+            )
 
-        if self._unit_lower == "kilobits/s":
-            return round(value / 1024 / 8, 3)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the state once per coordinator update."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
-        return value
+    @property
+    def available(self) -> bool:
+        # CoordinatorEntity.available ignores _attr_available.
+        return self._attr_available and self.coordinator.last_update_success
 
 
 class NetdataAlarms(CoordinatorEntity, SensorEntity):
@@ -140,73 +176,77 @@ class NetdataAlarms(CoordinatorEntity, SensorEntity):
     def __init__(self, coordinator, name, host, port):
         """Initialize the Netdata alarm sensor."""
         super().__init__(coordinator)
-        self._state = None
-        self._name = name
-        self._host = host
-        self._port = port
-    
-    @property
-    def unique_id(self):
-        return f"netdata-alarm-{self._host}-{self._port}"
 
-    @property
-    def name(self):
-        """Return the name of the sensor."""
-        return f"{self._name} Alarms"
+        self._attr_unique_id = f"netdata-alarm-{host}-{port}"
+        self._attr_name = f"{name} Alarms"
 
-    @property
-    def native_value(self):
-        """Return the state of the resources."""
-        alarms = self.coordinator.data["alarms"]["alarms"]
-        self._state = None
-        number_of_alarms = len(alarms)
-        number_of_relevant_alarms = number_of_alarms
-
-        _LOGGER.debug("Host %s has %s alarms", self.name, number_of_alarms)
-
-        for alarm in alarms:
-            if alarms[alarm]["recipient"] == "silent":
-                number_of_relevant_alarms = number_of_relevant_alarms - 1
-            elif alarms[alarm]["status"] == "CLEAR":
-                number_of_relevant_alarms = number_of_relevant_alarms - 1
-            elif alarms[alarm]["status"] == "UNDEFINED":
-                number_of_relevant_alarms = number_of_relevant_alarms - 1
-            elif alarms[alarm]["status"] == "UNINITIALIZED":
-                number_of_relevant_alarms = number_of_relevant_alarms - 1
-            elif alarms[alarm]["status"] == "CRITICAL":
-                self._state = "critical"
-                return
-        self._state = "ok" if number_of_relevant_alarms == 0 else "warning"
-        return self._state
+        self._update_from_data()
 
-    @property
-    def icon(self):
-        """Status symbol if type is symbol."""
-        if self._state == "ok":
-            return "mdi:check"
-        if self._state == "warning":
-            return "mdi:alert-outline"
-        if self._state == "critical":
-            return "mdi:alert"
-        return "mdi:crosshairs-question"
+    def _update_from_data(self):
+        alarms = self.coordinator.data["alarms"]["alarms"].values()
+
+        _LOGGER.debug("Host %s has %s alarms", self._attr_name, len(alarms))
+
+        if any(
+            a["status"] == "CRITICAL" and a["recipient"] != "silent"
+            for a in alarms
+        ):
+            state = "critical"
+        else:
+            number_of_relevant_alarms = sum(
+                1
+                for a in alarms
+                if a["recipient"] != "silent" and a["status"] not in _DISMISS_STATUSES
+            )
+            state = "ok" if number_of_relevant_alarms == 0 else "warning"
+
+        self._attr_native_value = state
+        self._attr_icon = _ALARM_ICONS.get(state, "mdi:crosshairs-question")
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the alarm state once per coordinator update."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
 
 class NetdataData(DataUpdateCoordinator):
     """The class for handling the data retrieval."""
 
-    def __init__(self, hass, host, port, interval):
+    def __init__(self, hass, host, port, interval, chart_filter=frozenset(), keys=frozenset()):
         """Initialize the data object."""
         super().__init__(
             hass, _LOGGER, name=DOMAIN, update_interval=timedelta(seconds=interval)
         )
         self.session = async_get_clientsession(hass, False)
         self.url_allmetrics = f"http://{host}:{port}/api/v1/allmetrics?format=json&help=no&types=no&timestamps=yes&names=yes&data=average"
+        if chart_filter:
+            # Only ask netdata for the charts we actually expose. filter= is
+            # a netdata simple pattern, whose alternatives are space separated.
+            self.url_allmetrics += f"&filter={quote(' '.join(sorted(chart_filter)))}"
         self.url_alarms = f"http://{host}:{port}/api/v1/alarms?all&format=json"
+        self._charts = chart_filter
+        self._keys = keys
+
+    async def _async_fetch(self, url):
+        request = await self.session.get(url=url)
+        return orjson.loads(await request.read())
 
     async def _async_update_data(self):
-        data = {}
-        request = await self.session.get(url=self.url_allmetrics)
-        data["metrics"] = await request.json()
-        request = await self.session.get(url=self.url_alarms)
-        data["alarms"] = await request.json()
-        return data
+        metrics, alarms = await asyncio.gather(
+            self._async_fetch(self.url_allmetrics),
+            self._async_fetch(self.url_alarms),
+        )
+        # Index only the configured resources; netdata may report far more.
+        flat = {}
+        for key in self._keys:
+            chart = metrics.get(key[0])
+            if chart is None:
+                continue
+            dim = chart["dimensions"].get(key[1])
+            if dim is not None:
+                flat[key] = dim["value"]
+        units = {
+            chart: metrics[chart]["units"] for chart in self._charts if chart in metrics
+        }
+        return {"alarms": alarms, "flat": flat, "units": units}